@@ -25,14 +25,19 @@ let mainChart = null;
 let exchangeChart = null;
 let currentData = null;
 let currencyRates = {};
+let historicalRates = [];
+let historicalRatesByDay = new Map(); // toDateString() -> rate entry, for O(1) date lookups
 let isDarkMode = true;
 
 // Caching system for API optimization
 const cache = {
-    currencyRates: { data: null, timestamp: 0, duration: 300000 }, // 5 minutes
-    marketOverview: { data: null, timestamp: 0, duration: 60000 }, // 1 minute
+    currencyRates: { data: null, timestamp: 0, duration: 300000, persist: true }, // 5 minutes, survives reloads
+    marketOverview: { data: null, timestamp: 0, duration: 60000, persist: true }, // 1 minute, shared across tabs
     financialData: {} // Per-symbol cache
 };
+const FINANCIAL_DATA_CACHE_DURATION = 60000; // 1 minute
+const CHART_FETCH_TIMEOUT = 45000; // Multi-decade daily series (~11k points) can be slow via the proxy
+const HISTORICAL_RATES_FETCH_TIMEOUT = 45000; // Multi-decade rate ranges are as large as the chart series
 
 // Rate limiting
 const rateLimiter = {
@@ -74,6 +79,31 @@ const indexConfig = {
     }
 };
 
+// Symbols shown in the market overview, derived once at load instead of on every refresh
+const OVERVIEW_SYMBOLS = Object.keys(indexConfig).slice(0, 8);
+
+// Display labels for the timeframe buttons, used in the chart titles
+const TIMEFRAME_LABELS = {
+    '1d': '1 Day',
+    '5d': '5 Days',
+    '1mo': '1 Month',
+    '3mo': '3 Months',
+    '6mo': '6 Months',
+    'ytd': 'Year to Date',
+    '1y': '1 Year',
+    '2y': '2 Years',
+    '5y': '5 Years',
+    '10y': '10 Years',
+    '15y': '15 Years',
+    '20y': '20 Years',
+    '25y': '25 Years',
+    '30y': '30 Years',
+    '35y': '35 Years',
+    '40y': '40 Years',
+    '45y': '45 Years',
+    'max': 'Max'
+};
+
 
 
 // Access control check
@@ -272,20 +302,7 @@ function updateChartTitle() {
     const selectedCurrency = elements.currencySelect.value;
     const timeframe = getActiveTimeframe();
     
-    // Format timeframe for display
-    const timeframeMap = {
-        '1d': '1 Day',
-        '5d': '5 Days', 
-        '1mo': '1 Month',
-        '3mo': '3 Months',
-        '6mo': '6 Months',
-        '1y': '1 Year',
-        '2y': '2 Years',
-        '5y': '5 Years',
-        'max': 'Max'
-    };
-    
-    const timeframeDisplay = timeframeMap[timeframe] || timeframe;
+    const timeframeDisplay = TIMEFRAME_LABELS[timeframe] || timeframe;
     const title = `${indexInfo.name} Performance (${timeframeDisplay}) - ${selectedCurrency}`;
     
     if (elements.chartTitle) {
@@ -297,28 +314,7 @@ function updateChartTitle() {
 function updateExchangeChartTitle() {
     const timeframe = getActiveTimeframe();
     
-    // Format timeframe for display
-    const timeframeMap = {
-        '1d': '1 Day',
-        '5d': '5 Days', 
-        '1mo': '1 Month',
-        '3mo': '3 Months',
-        '6mo': '6 Months',
-        'ytd': 'Year to Date',
-        '1y': '1 Year',
-        '2y': '2 Years',
-        '5y': '5 Years',
-        '10y': '10 Years',
-        '15y': '15 Years',
-        '20y': '20 Years',
-        '25y': '25 Years',
-        '30y': '30 Years',
-        '35y': '35 Years',
-        '40y': '40 Years',
-        '45y': '45 Years'
-    };
-    
-    const timeframeDisplay = timeframeMap[timeframe] || timeframe;
+    const timeframeDisplay = TIMEFRAME_LABELS[timeframe] || timeframe;
     const title = `USD/NOK Exchange Rate (${timeframeDisplay})`;
     
     if (elements.exchangeChartTitle) {
@@ -412,6 +408,17 @@ function debounce(func, wait) {
     };
 }
 
+// Sort entries with a Date 'date' field chronologically, in place. Timestamps are read once per
+// entry up front (decorate-sort-undecorate) rather than converting both Dates on every comparison.
+function sortByDate(items) {
+    const decorated = items.map(item => [item.date.getTime(), item]);
+    decorated.sort((a, b) => a[0] - b[0]);
+    for (let i = 0; i < decorated.length; i++) {
+        items[i] = decorated[i][1];
+    }
+    return items;
+}
+
 // Rate limiting function
 function checkRateLimit() {
     const now = Date.now();
@@ -438,15 +445,101 @@ function getCachedData(key) {
     if (cached && Date.now() - cached.timestamp < cached.duration) {
         return cached.data;
     }
+    
+    // Fall back to the copy persisted by an earlier page load, if still fresh
+    if (cached?.persist) {
+        const stored = readPersistedCache(key);
+        if (stored && Date.now() - stored.timestamp < cached.duration) {
+            cached.data = stored.data;
+            cached.timestamp = stored.timestamp;
+            return stored.data;
+        }
+    }
     return null;
 }
 
-function setCachedData(key, data) {
+// Pass shareable = false to keep a value in this page's memory only, e.g. hard-coded fallback
+// data that must not be written to localStorage and served to reloads or other tabs as real
+function setCachedData(key, data, shareable = true) {
     cache[key] = {
         data: data,
         timestamp: Date.now(),
-        duration: cache[key]?.duration || 300000
+        duration: cache[key]?.duration || 300000,
+        persist: cache[key]?.persist || false
+    };
+    
+    if (cache[key].persist && shareable) {
+        try {
+            localStorage.setItem(`cache:${key}`, JSON.stringify({ data: data, timestamp: cache[key].timestamp }));
+        } catch (error) {
+            console.warn(`Could not persist ${key} cache:`, error);
+        }
+    }
+}
+
+function readPersistedCache(key) {
+    try {
+        const stored = JSON.parse(localStorage.getItem(`cache:${key}`));
+        if (stored && typeof stored.timestamp === 'number') {
+            return stored;
+        }
+    } catch (error) {
+        console.warn(`Ignoring unreadable ${key} cache:`, error);
+    }
+    return null;
+}
+
+// Per-symbol cache for parsed chart data, keyed by symbol and range
+function getCachedFinancialData(key) {
+    const cached = cache.financialData[key];
+    if (cached && Date.now() - cached.timestamp < FINANCIAL_DATA_CACHE_DURATION) {
+        return cached.data;
+    }
+    
+    // An expired entry still holds a full series and its rates; release it
+    delete cache.financialData[key];
+    return null;
+}
+
+function setCachedFinancialData(key, data) {
+    // Prune every other expired entry too, so ranges that are never revisited do not accumulate
+    const now = Date.now();
+    for (const cachedKey of Object.keys(cache.financialData)) {
+        if (now - cache.financialData[cachedKey].timestamp >= FINANCIAL_DATA_CACHE_DURATION) {
+            delete cache.financialData[cachedKey];
+        }
+    }
+    
+    cache.financialData[key] = {
+        data: data,
+        timestamp: Date.now()
+    };
+}
+
+// Fetch JSON through the CORS proxy, falling back to the direct API.
+// Every attempt is bounded by a timeout so a stalled request never blocks the pipeline.
+// The timeout covers reading the body too, so callers expecting large payloads should pass a longer one.
+async function fetchJSON(url, timeout = 10000) {
+    const fetchWithTimeout = async (target) => {
+        const controller = new AbortController();
+        const timeoutId = setTimeout(() => controller.abort(), timeout);
+        try {
+            const response = await fetch(target, { signal: controller.signal });
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            return await response.json();
+        } finally {
+            clearTimeout(timeoutId);
+        }
     };
+    
+    try {
+        return await fetchWithTimeout(`https://api.allorigins.win/raw?url=${encodeURIComponent(url)}`);
+    } catch (error) {
+        console.log(`Proxy failed (${error.message}), trying direct API...`);
+        return await fetchWithTimeout(url);
+    }
 }
 
 // Get the currently active timeframe from buttons
@@ -457,7 +550,8 @@ function getActiveTimeframe() {
 
 
 
-// Historical exchange rates management using Norges Bank API
+// Historical exchange rates management using Norges Bank API.
+// Resolves to { rates, synthetic }; synthetic is true when both APIs failed and the rates are generated.
 async function loadHistoricalExchangeRates(startDate, endDate) {
     console.log('Loading historical exchange rates from Norges Bank:', startDate, 'to', endDate);
     
@@ -476,51 +570,33 @@ async function loadHistoricalExchangeRates(startDate, endDate) {
         
         console.log('Fetching from Norges Bank API:', apiUrl);
         
-        // Add timeout to prevent long buffering
-        const controller = new AbortController();
-        const timeoutId = setTimeout(() => controller.abort(), 10000); // 10 second timeout
-        
-        // Try with CORS proxy first
-        const proxyUrl = `https://api.allorigins.win/raw?url=${encodeURIComponent(apiUrl)}`;
-        let response = await fetch(proxyUrl, { signal: controller.signal });
-        
-        clearTimeout(timeoutId);
+        const data = await fetchJSON(apiUrl, HISTORICAL_RATES_FETCH_TIMEOUT);
+        console.log('Norges Bank exchange rates loaded successfully');
         
-        if (!response.ok) {
-            console.log('Proxy failed, trying direct API...');
-            const directController = new AbortController();
-            const directTimeoutId = setTimeout(() => directController.abort(), 8000); // 8 second timeout
-            response = await fetch(apiUrl, { signal: directController.signal });
-            clearTimeout(directTimeoutId);
-        }
-        
-        if (response.ok) {
-            const data = await response.json();
-            console.log('Norges Bank exchange rates loaded successfully');
+        if (data.data && data.data.dataSets && data.data.dataSets[0] && data.data.dataSets[0].series) {
+            const series = data.data.dataSets[0].series['0:0:0:0'];
+            const observations = series.observations;
+            const timeValues = data.data.structure.dimensions.observation[0].values;
             
-            if (data.data && data.data.dataSets && data.data.dataSets[0] && data.data.dataSets[0].series) {
-                const series = data.data.dataSets[0].series['0:0:0:0'];
-                const observations = series.observations;
-                const timeValues = data.data.structure.dimensions.observation[0].values;
+            // Convert to array of daily rates, reading only each observation's period and value.
+            // The keys are collected once up front rather than on every loop iteration.
+            const observationKeys = Object.keys(observations);
+            const dailyRates = [];
+            for (const key of observationKeys) {
+                const dateStr = timeValues[key].id;
+                const rate = parseFloat(observations[key][0]);
                 
-                // Convert to array of daily rates
-                const dailyRates = [];
-                for (let i = 0; i < Object.keys(observations).length; i++) {
-                    const dateStr = timeValues[i].id;
-                    const rate = parseFloat(observations[i.toString()][0]);
-                    
-                    dailyRates.push({
-                        date: new Date(dateStr),
-                        rate: rate
-                    });
-                }
-                
-                // Sort by date
-                dailyRates.sort((a, b) => a.date - b.date);
-                console.log('Processed Norges Bank daily rates:', dailyRates.length, 'days');
-                console.log('Sample Norges Bank rates:', dailyRates.slice(0, 3));
-                return dailyRates;
+                dailyRates.push({
+                    date: new Date(dateStr),
+                    rate: rate
+                });
             }
+            
+            // Sort by date
+            sortByDate(dailyRates);
+            console.log('Processed Norges Bank daily rates:', dailyRates.length, 'days');
+            console.log('Sample Norges Bank rates:', dailyRates.slice(0, 3));
+            return { rates: dailyRates, synthetic: false };
         }
         
         throw new Error('Failed to load Norges Bank historical rates');
@@ -534,30 +610,21 @@ async function loadHistoricalExchangeRates(startDate, endDate) {
             const endDateStr = endDate.toISOString().split('T')[0];
             const frankfurterUrl = `https://api.frankfurter.app/${startDateStr}..${endDateStr}?from=USD&to=NOK`;
             
-            const proxyUrl = `https://api.allorigins.win/raw?url=${encodeURIComponent(frankfurterUrl)}`;
-            let response = await fetch(proxyUrl);
-            
-            if (!response.ok) {
-                response = await fetch(frankfurterUrl);
-            }
+            const data = await fetchJSON(frankfurterUrl, HISTORICAL_RATES_FETCH_TIMEOUT);
+            console.log('Frankfurter fallback rates loaded');
             
-            if (response.ok) {
-                const data = await response.json();
-                console.log('Frankfurter fallback rates loaded');
-                
-                if (data.rates) {
-                    const dailyRates = [];
-                    for (const date in data.rates) {
-                        dailyRates.push({
-                            date: new Date(date),
-                            rate: data.rates[date].NOK
-                        });
-                    }
-                    
-                    dailyRates.sort((a, b) => a.date - b.date);
-                    console.log('Processed Frankfurter daily rates:', dailyRates.length, 'days');
-                    return dailyRates;
+            if (data.rates) {
+                const dailyRates = [];
+                for (const date in data.rates) {
+                    dailyRates.push({
+                        date: new Date(date),
+                        rate: data.rates[date].NOK
+                    });
                 }
+                
+                sortByDate(dailyRates);
+                console.log('Processed Frankfurter daily rates:', dailyRates.length, 'days');
+                return { rates: dailyRates, synthetic: false };
             }
         } catch (frankfurterError) {
             console.error('Frankfurter fallback also failed:', frankfurterError);
@@ -584,12 +651,24 @@ async function loadHistoricalExchangeRates(startDate, endDate) {
         
         console.log('Using synthetic historical rates:', dailyRates.length, 'days');
         console.log('Sample synthetic rates:', dailyRates.slice(0, 3));
-        return dailyRates;
+        return { rates: dailyRates, synthetic: true };
     }
 }
 
+// Pending currency rate request, shared so concurrent callers wait on one fetch
+let currencyRatesRequest = null;
+
 // Current currency rates management with caching and rate limiting
-async function loadCurrencyRates() {
+function loadCurrencyRates() {
+    if (!currencyRatesRequest) {
+        currencyRatesRequest = fetchCurrencyRates().finally(() => {
+            currencyRatesRequest = null;
+        });
+    }
+    return currencyRatesRequest;
+}
+
+async function fetchCurrencyRates() {
     // Check cache first
     const cachedRates = getCachedData('currencyRates');
     if (cachedRates) {
@@ -610,16 +689,8 @@ async function loadCurrencyRates() {
         
         console.log('Fetching current USD/NOK rate from Norges Bank...');
         
-        // Try with CORS proxy first
-        const proxyUrl = `https://api.allorigins.win/raw?url=${encodeURIComponent(norgesBankUrl)}`;
-        let response = await fetch(proxyUrl);
-        
-        if (!response.ok) {
-            response = await fetch(norgesBankUrl);
-        }
-        
-        if (response.ok) {
-            const data = await response.json();
+        try {
+            const data = await fetchJSON(norgesBankUrl);
             
             if (data.data && data.data.dataSets && data.data.dataSets[0] && data.data.dataSets[0].series) {
                 const series = data.data.dataSets[0].series['0:0:0:0'];
@@ -637,43 +708,34 @@ async function loadCurrencyRates() {
                     return;
                 }
             }
+        } catch (error) {
+            console.warn('Norges Bank current rate request failed:', error);
         }
         
         // Fallback to Frankfurter API
         console.log('Norges Bank failed, falling back to Frankfurter...');
         const apis = [
-            'https://api.frankfurter.app/latest?from=USD'
+            'https://api.frankfurter.app/latest?from=USD&to=NOK' // Only NOK is used; skip the other ~30 rates
         ];
         
         for (const api of apis) {
             try {
-                // Primary approach: Use the working CORS proxy
-                const proxyUrl = `https://api.allorigins.win/raw?url=${encodeURIComponent(api)}`;
-                let response = await fetch(proxyUrl);
-                
-                // If proxy fails, try direct
-                if (!response.ok) {
-                    response = await fetch(api);
-                }
+                const data = await fetchJSON(api);
                 
-                if (response.ok) {
-                    const data = await response.json();
-                    
-                    if (data.rates) {
-                        currencyRates = data.rates;
-                        currencyRates.USD = 1; // Base currency
-                        setCachedData('currencyRates', currencyRates);
-                        console.log('Real currency rates loaded from:', api);
-                        console.log('Available currencies:', Object.keys(currencyRates));
-                        return;
-                    } else if (data.conversion_rates) {
-                        currencyRates = data.conversion_rates;
-                        currencyRates.USD = 1;
-                        setCachedData('currencyRates', currencyRates);
-                        console.log('Real currency rates loaded from:', api);
-                        console.log('Available currencies:', Object.keys(currencyRates));
-                        return;
-                    }
+                if (data.rates) {
+                    currencyRates = data.rates;
+                    currencyRates.USD = 1; // Base currency
+                    setCachedData('currencyRates', currencyRates);
+                    console.log('Real currency rates loaded from:', api);
+                    console.log('Available currencies:', Object.keys(currencyRates));
+                    return;
+                } else if (data.conversion_rates) {
+                    currencyRates = data.conversion_rates;
+                    currencyRates.USD = 1;
+                    setCachedData('currencyRates', currencyRates);
+                    console.log('Real currency rates loaded from:', api);
+                    console.log('Available currencies:', Object.keys(currencyRates));
+                    return;
                 }
             } catch (error) {
                 console.warn(`Failed to load from ${api}:`, error);
@@ -691,7 +753,7 @@ async function loadCurrencyRates() {
             NOK: 10.5 // Approximate USD/NOK rate
         };
         console.log('Using fallback currency rates:', currencyRates);
-        setCachedData('currencyRates', currencyRates);
+        setCachedData('currencyRates', currencyRates, false);
     }
 }
 
@@ -774,61 +836,52 @@ async function loadFinancialData(customTimeframe = null) {
                 effectiveTimeframe = '45y';
             }
         }
-        const baseUrl = `https://query1.finance.yahoo.com/v8/finance/chart/${symbol}?interval=1d&range=${effectiveTimeframe}&includePrePost=false&events=div%2Csplit`;
-        
-        console.log('Fetching data for symbol:', symbol, 'timeframe:', timeframe, 'effective timeframe:', effectiveTimeframe);
-        console.log('API URL:', baseUrl);
+        // Request only the OHLC/adjclose series; dividend and split events are never read
+        const baseUrl = `https://query1.finance.yahoo.com/v8/finance/chart/${symbol}?interval=1d&range=${effectiveTimeframe}&includePrePost=false`;
         
-        // Try multiple approaches
-        let data = null;
+        // Reuse the already-parsed series while it is fresh instead of refetching and reprocessing it
+        const cacheKey = `${symbol}:${effectiveTimeframe}`;
+        const cachedEntry = getCachedFinancialData(cacheKey);
         
-        // Primary approach: Use the working CORS proxy
-        try {
-            const proxyUrl = `https://api.allorigins.win/raw?url=${encodeURIComponent(baseUrl)}`;
-            const response = await fetch(proxyUrl);
-            if (response.ok) {
-                data = await response.json();
-                console.log('Real market data loaded successfully via proxy');
-            } else {
-                throw new Error(`Proxy response not ok: ${response.status}`);
-            }
-        } catch (error) {
-            console.log('Primary proxy failed, trying direct API...');
+        if (cachedEntry) {
+            console.log('Using cached market data for', cacheKey);
+            currentData = cachedEntry.currentData;
+            setHistoricalRates(cachedEntry.historicalRates);
+        } else {
+            console.log('Fetching data for symbol:', symbol, 'timeframe:', timeframe, 'effective timeframe:', effectiveTimeframe);
+            console.log('API URL:', baseUrl);
+            
+            // Try multiple approaches
+            let data = null;
             
-            // Fallback: Try direct API (works in some browsers)
             try {
-                const response = await fetch(baseUrl);
-                if (response.ok) {
-                    data = await response.json();
-                    console.log('Direct API call successful');
-                } else {
-                    throw new Error(`Direct API response not ok: ${response.status}`);
-                }
-            } catch (directError) {
-                console.log('Direct API also failed');
+                data = await fetchJSON(baseUrl, CHART_FETCH_TIMEOUT);
+                console.log('Real market data loaded successfully');
+            } catch (error) {
+                console.log('All data sources failed:', error);
                 throw new Error('All data sources failed');
             }
+            
+            // If all APIs fail, show error and retry
+            if (!data || !data.chart || !data.chart.result || !data.chart.result[0]) {
+                throw new Error('No valid data received from any API');
+            }
+            
+            // Process successful data
+            currentData = processFinancialData(data.chart.result[0]);
+            
+            // For 1-day timeframe, ensure we have the most recent data
+            if (timeframe === '1d' && currentData && currentData.data.length > 0) {
+                // Get the most recent data point (should be today or latest available)
+                const latestData = currentData.data[currentData.data.length - 1];
+                console.log('Latest 1-day data point:', {
+                    date: latestData.date.toISOString(),
+                    close: latestData.close,
+                    isToday: latestData.date.toDateString() === new Date().toDateString()
+                });
+            }
         }
-        
-        // If all APIs fail, show error and retry
-        if (!data || !data.chart || !data.chart.result || !data.chart.result[0]) {
-            throw new Error('No valid data received from any API');
-        }
-        
-        // Process successful data
-        currentData = processFinancialData(data.chart.result[0]);
-        
-        // For 1-day timeframe, ensure we have the most recent data
-        if (timeframe === '1d' && currentData && currentData.data.length > 0) {
-            // Get the most recent data point (should be today or latest available)
-            const latestData = currentData.data[currentData.data.length - 1];
-            console.log('Latest 1-day data point:', {
-                date: latestData.date.toISOString(),
-                close: latestData.close,
-                isToday: latestData.date.toDateString() === new Date().toDateString()
-            });
-        }
-        
+            
         // Ensure currency rates are loaded before rendering chart
         if (Object.keys(currencyRates).length === 0) {
             console.log('Currency rates not loaded yet, loading them first...');
@@ -836,11 +889,17 @@ async function loadFinancialData(customTimeframe = null) {
         }
         
         // Load historical exchange rates for accurate NOK conversion
-        if (currentData && currentData.data.length > 0) {
+        if (!cachedEntry && currentData && currentData.data.length > 0) {
             const startDate = currentData.data[0].date;
             const endDate = currentData.data[currentData.data.length - 1].date;
             console.log('Loading historical rates from', startDate, 'to', endDate);
-            historicalRates = await loadHistoricalExchangeRates(startDate, endDate);
+            const { rates, synthetic } = await loadHistoricalExchangeRates(startDate, endDate);
+            setHistoricalRates(rates);
+            
+            // Generated placeholder rates must not be reused; the next load should retry the APIs
+            if (!synthetic) {
+                setCachedFinancialData(cacheKey, { currentData, historicalRates });
+            }
         }
         
         // Double-check that currency rates are loaded
@@ -859,9 +918,21 @@ async function loadFinancialData(customTimeframe = null) {
                 }
             }
             
-            renderChart();
+            // Rebuilding both charts and the table is the costly part of a refresh; skip it when the
+            // reload resolved to the very same series, rates and view settings already on screen
+            const renderState = {
+                data: currentData,
+                historicalRates: historicalRates,
+                currencyRates: currencyRates,
+                currency: elements.currencySelect.value,
+                timeframe: getActiveTimeframe()
+            };
+            if (!mainChart || !isSameRenderState(lastRenderState, renderState)) {
+                renderChart();
+                updatePerformanceTable();
+                lastRenderState = renderState;
+            }
             updateStatistics();
-            updatePerformanceTable();
             updateChartHeader(symbol);
             updateLastUpdated();
         } else {
@@ -890,6 +961,18 @@ async function loadFinancialData(customTimeframe = null) {
     }
 }
 
+// Inputs of the charts currently on screen, compared by identity to detect redundant re-renders
+let lastRenderState = null;
+
+function isSameRenderState(a, b) {
+    return a !== null &&
+        a.data === b.data &&
+        a.historicalRates === b.historicalRates &&
+        a.currencyRates === b.currencyRates &&
+        a.currency === b.currency &&
+        a.timeframe === b.timeframe;
+}
+
 // Real data only - no demo fallback
 function ensureRealData() {
     console.log('Ensuring real data is loaded...');
@@ -907,14 +990,15 @@ let lastPrice = null;
 // Preload data for faster initial load
 async function preloadData() {
     try {
-        // Load currency rates immediately
-        await loadCurrencyRates();
+        // Start currency rates immediately; the chart fetch below runs alongside it
+        // and waits on the same request if it needs the rates before they arrive
+        const currencyRatesLoaded = loadCurrencyRates();
         
         // Load market overview in background
         loadMarketOverview();
         
         // Load main chart data using the same reliable method
-        await loadFinancialData();
+        await Promise.all([currencyRatesLoaded, loadFinancialData()]);
     
 
         
@@ -966,6 +1050,7 @@ function startLiveUpdates(symbol) {
                     // Update the latest price in current data
                     if (currentData && currentData.data.length > 0) {
                         currentData.data[currentData.data.length - 1].close = latestPrice;
+                        invalidateConversionCache();
                         updateStatistics();
                         updateLastUpdated();
                         
@@ -1056,31 +1141,42 @@ function processFinancialData(result) {
     const quotes = result.indicators.quote[0];
     const adjClose = result.indicators.adjclose[0].adjclose;
     
-    // Process data with proper date indexing and closing prices
-    const data = timestamps.map((timestamp, index) => {
-        const date = new Date(timestamp * 1000);
-        const closePrice = quotes.close[index];
+    const { open, high, low, close, volume } = quotes;
+    
+    // Build the series in a single pass, skipping points without a usable closing price
+    const data = [];
+    let previousTimestamp = -Infinity;
+    let isSorted = true;
+    for (let index = 0; index < timestamps.length; index++) {
         const adjClosePrice = adjClose[index];
         
         // Use adjusted close price if available, otherwise use regular close
-        const finalClose = adjClosePrice !== null && adjClosePrice !== undefined ? adjClosePrice : closePrice;
+        const finalClose = adjClosePrice !== null && adjClosePrice !== undefined ? adjClosePrice : close[index];
+        if (finalClose === null || finalClose === undefined || isNaN(finalClose)) {
+            continue;
+        }
         
-        return {
-            date: date,
-            open: quotes.open[index],
-            high: quotes.high[index],
-            low: quotes.low[index],
+        const timestamp = timestamps[index];
+        if (timestamp < previousTimestamp) {
+            isSorted = false;
+        }
+        previousTimestamp = timestamp;
+        
+        data.push({
+            date: new Date(timestamp * 1000),
+            open: open[index],
+            high: high[index],
+            low: low[index],
             close: finalClose, // Use adjusted close for accuracy
-            volume: quotes.volume[index],
+            volume: volume[index],
             adjClose: adjClosePrice
-        };
-    }).filter(item => {
-        // Filter out any data points with null/undefined closing prices
-        return item.close !== null && item.close !== undefined && !isNaN(item.close);
-    });
+        });
+    }
     
-    // Sort by date to ensure proper chronological order
-    data.sort((a, b) => a.date - b.date);
+    // Yahoo returns timestamps in ascending order; only sort when that does not hold
+    if (!isSorted) {
+        sortByDate(data);
+    }
     
     console.log('Processed data points:', data.length);
     console.log('Date range:', data[0]?.date?.toISOString(), 'to', data[data.length - 1]?.date?.toISOString());
@@ -1157,9 +1253,7 @@ function renderMainChart() {
     let startRate = null;
     if (historicalRates && historicalRates.length > 0 && selectedCurrency === 'NOK' && indexInfo.currency === 'USD') {
         const startDate = currentData.data[0].date;
-        const startRateData = historicalRates.find(rate => 
-            rate.date.toDateString() === startDate.toDateString()
-        );
+        const startRateData = findRateForDate(startDate);
         if (startRateData) {
             startRate = startRateData.rate;
             console.log('Using start rate for both lines:', startRate, 'for date:', startDate.toDateString());
@@ -1320,9 +1414,7 @@ function renderMainChart() {
                             let exchangeRate = '';
                             if (historicalRates && historicalRates.length > 0) {
                                 const targetDate = date.toDateString();
-                                const rateData = historicalRates.find(rate => 
-                                    rate.date.toDateString() === targetDate
-                                );
+                                const rateData = historicalRatesByDay.get(targetDate);
                                 if (rateData) {
                                     exchangeRate = ` (USD/NOK: ${rateData.rate.toFixed(4)})`;
                                 }
@@ -1562,11 +1654,48 @@ function calculateCurrencyImpactOverTime(data, targetCurrency, sourceCurrency) {
 
 // Global variable to store historical exchange rates (already declared at top)
 
+// Converted copies of the current series, reused until the series or the rates change
+const conversionCache = {
+    data: null,
+    historicalRates: null,
+    currencyRates: null,
+    results: new Map()
+};
+
+// Drop memoised conversions after the current series is modified in place
+function invalidateConversionCache() {
+    conversionCache.data = null;
+}
+
 function convertDataToCurrency(data, targetCurrency, sourceCurrency, startRateOverride = null) {
     if (targetCurrency === sourceCurrency) {
         return data;
     }
     
+    // Only the full current series is converted repeatedly (chart, impact lines, table, export)
+    if (!currentData || data !== currentData.data) {
+        return computeCurrencyConversion(data, targetCurrency, sourceCurrency, startRateOverride);
+    }
+    
+    if (conversionCache.data !== data ||
+        conversionCache.historicalRates !== historicalRates ||
+        conversionCache.currencyRates !== currencyRates) {
+        conversionCache.data = data;
+        conversionCache.historicalRates = historicalRates;
+        conversionCache.currencyRates = currencyRates;
+        conversionCache.results = new Map();
+    }
+    
+    const key = `${targetCurrency}:${sourceCurrency}:${startRateOverride}`;
+    let converted = conversionCache.results.get(key);
+    if (!converted) {
+        converted = computeCurrencyConversion(data, targetCurrency, sourceCurrency, startRateOverride);
+        conversionCache.results.set(key, converted);
+    }
+    return converted;
+}
+
+function computeCurrencyConversion(data, targetCurrency, sourceCurrency, startRateOverride) {
     // If we have historical rates, use them for more accurate conversion
     if (historicalRates.length > 0 && targetCurrency === 'NOK' && sourceCurrency === 'USD') {
         console.log('Converting USD to NOK using historical rates. Historical rates count:', historicalRates.length);
@@ -1579,20 +1708,11 @@ function convertDataToCurrency(data, targetCurrency, sourceCurrency, startRateOv
                 rate = startRateOverride;
                 console.log(`First day using start rate: USD ${item.close} * ${rate} = NOK ${item.close * rate}`);
             } else {
-                // Find the closest historical rate for this date
-                const itemDate = new Date(item.date);
-                rate = findClosestRate(itemDate);
-                console.log(`Converting ${item.date}: USD ${item.close} * ${rate} = NOK ${item.close * rate}`);
+                // Find the closest historical rate for this date (points already carry a Date)
+                rate = findClosestRate(item.date);
             }
             
-            return {
-                ...item,
-                open: item.open * rate,
-                high: item.high * rate,
-                low: item.low * rate,
-                close: item.close * rate,
-                adjClose: item.adjClose * rate
-            };
+            return convertDataPoint(item, rate);
         });
     }
     
@@ -1600,14 +1720,38 @@ function convertDataToCurrency(data, targetCurrency, sourceCurrency, startRateOv
     const conversionRate = currencyRates[targetCurrency] / currencyRates[sourceCurrency];
     console.log('Using fallback conversion rate:', conversionRate, 'for', sourceCurrency, 'to', targetCurrency);
     
-    return data.map(item => ({
-        ...item,
-        open: item.open * conversionRate,
-        high: item.high * conversionRate,
-        low: item.low * conversionRate,
-        close: item.close * conversionRate,
-        adjClose: item.adjClose * conversionRate
-    }));
+    return data.map(item => convertDataPoint(item, conversionRate));
+}
+
+// Build a converted point with the same fixed field layout processFinancialData produces.
+// An explicit literal keeps every point on one object shape, unlike copying with spread.
+function convertDataPoint(item, rate) {
+    return {
+        date: item.date,
+        open: item.open * rate,
+        high: item.high * rate,
+        low: item.low * rate,
+        close: item.close * rate,
+        volume: item.volume,
+        adjClose: item.adjClose * rate
+    };
+}
+
+// Replace the historical rates and rebuild the day index used by findRateForDate
+function setHistoricalRates(rates) {
+    historicalRates = rates;
+    historicalRatesByDay = new Map();
+    for (const rate of rates) {
+        const day = rate.date.toDateString();
+        if (!historicalRatesByDay.has(day)) {
+            historicalRatesByDay.set(day, rate);
+        }
+    }
+}
+
+// Look up the historical rate recorded on the same calendar day, if any
+function findRateForDate(date) {
+    return historicalRatesByDay.get(date.toDateString());
 }
 
 // Helper function to find the closest historical rate for a given date
@@ -1617,27 +1761,32 @@ function findClosestRate(targetDate) {
     }
     
     // Find exact match first
-    const exactMatch = historicalRates.find(rate => 
-        rate.date.toDateString() === targetDate.toDateString()
-    );
+    const exactMatch = findRateForDate(targetDate);
     
     if (exactMatch) {
         return exactMatch.rate;
     }
     
-    // Find closest date
-    let closestRate = historicalRates[0];
-    let minDiff = Math.abs(targetDate - closestRate.date);
-    
-    for (const rate of historicalRates) {
-        const diff = Math.abs(targetDate - rate.date);
-        if (diff < minDiff) {
-            minDiff = diff;
-            closestRate = rate;
+    // Rates are sorted by date, so binary search for the first rate on or after the target
+    let low = 0;
+    let high = historicalRates.length;
+    while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (historicalRates[mid].date < targetDate) {
+            low = mid + 1;
+        } else {
+            high = mid;
         }
     }
     
-    return closestRate.rate;
+    // The closest rate is either that one or its predecessor (earlier date wins ties)
+    if (low === historicalRates.length) {
+        return historicalRates[low - 1].rate;
+    }
+    if (low > 0 && targetDate - historicalRates[low - 1].date <= historicalRates[low].date - targetDate) {
+        return historicalRates[low - 1].rate;
+    }
+    return historicalRates[low].rate;
 }
 
 // Calculate index performance without currency changes (using starting rate)
@@ -1654,9 +1803,7 @@ function calculateIndexWithoutCurrencyChanges(data, targetCurrency, sourceCurren
     const startDate = data[0].date;
     
     // Find the exchange rate at the start of the selected period
-    const startRateData = historicalRates.find(rate => 
-        rate.date.toDateString() === startDate.toDateString()
-    );
+    const startRateData = findRateForDate(startDate);
     
     if (!startRateData) {
         console.error('Could not find exchange rate for start date:', startDate);
@@ -1751,12 +1898,8 @@ function updateStatistics() {
         const startDate = data[0].date;
         const endDate = data[data.length - 1].date;
         
-        const startRateData = historicalRates.find(rate => 
-            rate.date.toDateString() === startDate.toDateString()
-        );
-        const endRateData = historicalRates.find(rate => 
-            rate.date.toDateString() === endDate.toDateString()
-        );
+        const startRateData = findRateForDate(startDate);
+        const endRateData = findRateForDate(endDate);
         
         if (startRateData && endRateData) {
             const startRate = startRateData.rate;
@@ -1811,14 +1954,19 @@ function calculateCurrencyImpact(data, targetCurrency, sourceCurrency) {
 }
 
 function calculateVolatility(data) {
-    const returns = [];
+    // Single pass over daily returns (Welford's method) - no intermediate array or Math.pow calls
+    let count = 0;
+    let mean = 0;
+    let sumSquaredDiff = 0;
     for (let i = 1; i < data.length; i++) {
         const dailyReturn = (data[i].close - data[i-1].close) / data[i-1].close;
-        returns.push(dailyReturn);
+        count++;
+        const delta = dailyReturn - mean;
+        mean += delta / count;
+        sumSquaredDiff += delta * (dailyReturn - mean);
     }
     
-    const mean = returns.reduce((sum, ret) => sum + ret, 0) / returns.length;
-    const variance = returns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / returns.length;
+    const variance = sumSquaredDiff / count;
     const stdDev = Math.sqrt(variance);
     
     // Annualized volatility (assuming 252 trading days)
@@ -1890,14 +2038,33 @@ function updatePerformanceTable() {
     });
 }
 
+// Pending market overview request; overlapping triggers (startup, tab focus, refresh timer) share it
+let marketOverviewRequest = null;
+
 // Enhanced market overview with live data
-async function loadMarketOverview() {
+function loadMarketOverview() {
+    if (!marketOverviewRequest) {
+        marketOverviewRequest = fetchMarketOverview().finally(() => {
+            marketOverviewRequest = null;
+        });
+    }
+    return marketOverviewRequest;
+}
+
+async function fetchMarketOverview() {
     try {
-        const symbols = Object.keys(indexConfig);
+        // Another tab (or an earlier load) may already have fetched a fresh snapshot
+        const cachedOverview = getCachedData('marketOverview');
+        if (cachedOverview) {
+            renderMarketOverview(cachedOverview);
+            startMarketOverviewUpdates();
+            return;
+        }
+        
         const overviewData = [];
         
         // Load data for all major indices with better error handling
-        const promises = symbols.slice(0, 8).map(async (symbol) => {
+        const promises = OVERVIEW_SYMBOLS.map(async (symbol) => {
             try {
                 // Use 1-minute data for more current prices
                 const response = await fetch(`https://query1.finance.yahoo.com/v8/finance/chart/${symbol}?interval=1m&range=1d`, {
@@ -1939,8 +2106,8 @@ async function loadMarketOverview() {
                 }
             } catch (error) {
                 console.error(`Error loading data for ${symbol}:`, error);
-                return null;
             }
+            return null;
         });
         
         const results = await Promise.allSettled(promises);
@@ -1948,6 +2115,10 @@ async function loadMarketOverview() {
             .filter(result => result.status === 'fulfilled' && result.value !== null)
             .map(result => result.value);
         
+        // An empty result means every quote failed; caching it would hide the overview for a minute
+        if (validResults.length > 0) {
+            setCachedData('marketOverview', validResults);
+        }
         renderMarketOverview(validResults);
         
         // Start live updates for market overview
@@ -1960,6 +2131,7 @@ async function loadMarketOverview() {
 
 // Live updates for market overview
 let marketOverviewInterval = null;
+const MARKET_OVERVIEW_UPDATE_INTERVAL = 30000; // Update every 30 seconds for more frequent updates
 
 function startMarketOverviewUpdates() {
     if (marketOverviewInterval) {
@@ -1968,10 +2140,18 @@ function startMarketOverviewUpdates() {
     
     marketOverviewInterval = setInterval(async () => {
         try {
-            const symbols = Object.keys(indexConfig).slice(0, 8);
-            const updatedData = [];
+            // If another tab stored a snapshot since this tab's last refresh, show it instead of refetching
+            const shared = readPersistedCache('marketOverview');
+            if (shared && shared.timestamp > cache.marketOverview.timestamp &&
+                Date.now() - shared.timestamp < MARKET_OVERVIEW_UPDATE_INTERVAL) {
+                cache.marketOverview.data = shared.data;
+                cache.marketOverview.timestamp = shared.timestamp;
+                renderMarketOverview(shared.data);
+                return;
+            }
             
-            for (const symbol of symbols) {
+            // Fetch all symbols concurrently so the refresh takes one round-trip, not one per index
+            const promises = OVERVIEW_SYMBOLS.map(async (symbol) => {
                 try {
                     const response = await fetch(`https://query1.finance.yahoo.com/v8/finance/chart/${symbol}?interval=1m&range=1d`);
                     const data = await response.json();
@@ -1988,7 +2168,7 @@ function startMarketOverviewUpdates() {
                             const change = currentPrice - previousPrice;
                             const changePercent = (change / previousPrice) * 100;
                             
-                            updatedData.push({
+                            return {
                                 symbol: symbol,
                                 name: indexConfig[symbol].name,
                                 price: currentPrice,
@@ -1996,21 +2176,29 @@ function startMarketOverviewUpdates() {
                                 changePercent: changePercent,
                                 currency: indexConfig[symbol].currency,
                                 timestamp: new Date()
-                            });
+                            };
                         }
                     }
                 } catch (error) {
                     console.warn(`Live update failed for ${symbol}:`, error);
                 }
-            }
+                return null;
+            });
+            
+            // Keep the original symbol order regardless of which request finishes first
+            const results = await Promise.allSettled(promises);
+            const updatedData = results
+                .filter(result => result.status === 'fulfilled' && result.value !== null)
+                .map(result => result.value);
             
             if (updatedData.length > 0) {
+                setCachedData('marketOverview', updatedData);
                 renderMarketOverview(updatedData);
             }
         } catch (error) {
             console.warn('Market overview live update failed:', error);
         }
-    }, 30000); // Update every 30 seconds for more frequent updates
+    }, MARKET_OVERVIEW_UPDATE_INTERVAL);
 }
 
 function renderMarketOverview(data) {
@@ -2032,15 +2220,24 @@ function renderMarketOverview(data) {
 }
 
 // Utility functions
+
+// Intl.NumberFormat instances are costly to construct and only a couple of currencies are used,
+// so keep one formatter per currency instead of building a new one on every call
+const currencyFormatters = new Map();
+
 function formatCurrency(value, currency) {
     if (value === null || value === undefined || isNaN(value)) return '--';
     
-    const formatter = new Intl.NumberFormat('en-US', {
-        style: 'currency',
-        currency: currency,
-        minimumFractionDigits: 2,
-        maximumFractionDigits: 2
-    });
+    let formatter = currencyFormatters.get(currency);
+    if (!formatter) {
+        formatter = new Intl.NumberFormat('en-US', {
+            style: 'currency',
+            currency: currency,
+            minimumFractionDigits: 2,
+            maximumFractionDigits: 2
+        });
+        currencyFormatters.set(currency, formatter);
+    }
     
     return formatter.format(value);
 }